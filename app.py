@@ -1,5 +1,5 @@
 import os
-from flask import Flask, render_template, request, jsonify, session, send_file
+from flask import Flask, render_template, request, jsonify, session, Response, url_for
 from flask_session import Session
 from flask_cors import CORS
 import openai
@@ -8,19 +8,71 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
+import copy
 import io
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
+from urllib.parse import quote
+from xml.sax.saxutils import escape
 import PyPDF2
 import docx
+from docx.enum.style import WD_STYLE_TYPE
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Inches, Pt, RGBColor
 from werkzeug.utils import secure_filename
 import json
+import re
+import time
+import gzip
+import hashlib
+import mimetypes
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 app = Flask(__name__)
 app.secret_key = os.environ.get("SECRET_KEY", "dev_secret_key_change_in_production")
 app.config['SESSION_TYPE'] = 'filesystem'
+# Export rendering limits: generated files spill from memory to disk past this size,
+# and are streamed back in fixed-size chunks instead of being held in a buffer.
+app.config['EXPORT_SPOOL_MAX_MEMORY'] = int(os.environ.get("EXPORT_SPOOL_MAX_MEMORY", 256 * 1024))
+app.config['EXPORT_STREAM_CHUNK_SIZE'] = 64 * 1024
+# Resume exports (PDF and DOCX) render on a bounded worker pool, and recent
+# small results are kept in an LRU cache keyed by format and payload, capped
+# by total bytes per worker (0 disables it).
+app.config['EXPORT_WORKERS'] = int(os.environ.get("EXPORT_WORKERS", min(4, os.cpu_count() or 1)))
+app.config['EXPORT_TIMEOUT'] = 30
+app.config['EXPORT_CACHE_MAX_BYTES'] = int(os.environ.get("EXPORT_CACHE_MAX_BYTES", 2 * 1024 * 1024))
+app.config['EXPORT_CACHE_MAX_ITEM_BYTES'] = 128 * 1024
+# Upper bound on flowables in an analysis report so a runaway AI response can't
+# blow up layout time and memory.
+app.config['REPORT_MAX_FLOWABLES'] = 200
+app.config['REPORT_LINES_PER_BLOCK'] = 25
 Session(app)
 CORS(app, supports_credentials=True)
 
+# Token budgets for LLM calls. Prompts are compacted and trimmed to these before
+# sending, and max_tokens is picked from what's left of the context window.
+app.config['AI_MODEL'] = os.environ.get("AI_MODEL", "gpt-3.5-turbo")
+app.config['AI_CONTEXT_WINDOW'] = int(os.environ.get("AI_CONTEXT_WINDOW", 4096))
+app.config['SUGGEST_INPUT_TOKEN_BUDGET'] = int(os.environ.get("SUGGEST_INPUT_TOKEN_BUDGET", 600))
+app.config['REVIEW_INPUT_TOKEN_BUDGET'] = int(os.environ.get("REVIEW_INPUT_TOKEN_BUDGET", 2000))
+app.config['SUGGEST_MAX_TOKENS'] = 300
+app.config['REVIEW_MAX_TOKENS'] = 800
+
 # Enhanced OpenAI client initialization with better error handling
 try:
     client = openai.OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
@@ -31,15 +83,111 @@ except Exception as e:
     print(f"Error initializing OpenAI client: {e}")
     client = None
 
+# ===== STATIC ASSETS =====
+
+ASSET_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+ASSET_MANIFEST = {}
+PAGE_CACHE = {}
+
+def compress_variants(body):
+    """Precompress a body, keeping only encodings that actually save bytes"""
+    variants = {}
+    gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+    if len(gzipped) < len(body):
+        variants['gzip'] = gzipped
+    if brotli is not None:
+        brotlied = brotli.compress(body, quality=11)
+        if len(brotlied) < len(body):
+            variants['br'] = brotlied
+    return variants
+
+def build_asset_manifest():
+    """Content-hash and precompress everything under static/ once at startup"""
+    ASSET_MANIFEST.clear()
+    for root, _, files in os.walk(app.static_folder):
+        for filename in files:
+            path = os.path.join(root, filename)
+            name = os.path.relpath(path, app.static_folder).replace(os.sep, '/')
+            with open(path, 'rb') as f:
+                body = f.read()
+
+            digest = hashlib.sha256(body).hexdigest()[:12]
+            stem, ext = os.path.splitext(name)
+            ASSET_MANIFEST[name] = {
+                'hashed_name': f"{stem}.{digest}{ext}",
+                'etag': digest,
+                'mimetype': mimetypes.guess_type(name)[0] or 'application/octet-stream',
+                'identity': body,
+                **compress_variants(body)
+            }
+
+    # Index by fingerprinted name for lookups in the asset route
+    for entry in list(ASSET_MANIFEST.values()):
+        ASSET_MANIFEST[entry['hashed_name']] = entry
+
+def negotiate_encoding(entry):
+    """Pick the best precompressed variant the client accepts"""
+    for encoding in ('br', 'gzip'):
+        if encoding in entry and request.accept_encodings[encoding]:
+            return encoding
+    return 'identity'
+
+@app.template_global()
+def asset_url(filename):
+    """url_for for static files, emitting a content-fingerprinted URL"""
+    entry = ASSET_MANIFEST.get(filename)
+    if not entry or app.debug:
+        return url_for('static', filename=filename)
+    return url_for('asset', filename=entry['hashed_name'])
+
+@app.route('/assets/<path:filename>')
+def asset(filename):
+    """Serve fingerprinted static assets, precompressed and cached forever"""
+    entry = ASSET_MANIFEST.get(filename)
+    if not entry or entry['hashed_name'] != filename:
+        return jsonify({'error': 'Asset not found'}), 404
+
+    encoding = negotiate_encoding(entry)
+    response = Response(entry[encoding], mimetype=entry['mimetype'])
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Cache-Control'] = ASSET_CACHE_CONTROL
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.set_etag(f"{entry['etag']}-{encoding}")
+    return response.make_conditional(request)
+
+def cached_page(template_name):
+    """Serve a fully static template, rendered once and revalidated by ETag"""
+    entry = PAGE_CACHE.get(template_name)
+    if entry is None or app.debug:
+        body = render_template(template_name).encode('utf-8')
+        entry = {
+            'etag': hashlib.sha256(body).hexdigest()[:16],
+            'identity': body,
+            **compress_variants(body)
+        }
+        PAGE_CACHE[template_name] = entry
+
+    encoding = negotiate_encoding(entry)
+    response = Response(entry[encoding], mimetype='text/html')
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.set_etag(f"{entry['etag']}-{encoding}")
+    return response.make_conditional(request)
+
+build_asset_manifest()
+
 # ===== MAIN ROUTES =====
 
 @app.route('/')
 def home():
-    return render_template('index.html')
+    return cached_page('index.html')
 
 @app.route('/templates')
 def templates():
-    return render_template('template_chooser.html')
+    return cached_page('template_chooser.html')
 
 @app.route('/builder', methods=['GET', 'POST'])
 def builder():
@@ -158,15 +306,19 @@ def ai_suggest():
             return jsonify({'error': 'No data provided'}), 400
 
         section = data.get('section', '').strip()
-        content = data.get('content', '').strip()
+        content = normalize_prompt_text(data.get('content', ''))
         job_title = data.get('job_title', '').strip()
 
         # Enhanced validation
         if not section or not content:
             return jsonify({'error': 'Section and content are required'}), 400
         
-        if len(content) > 2000:
-            return jsonify({'error': 'Content too long. Please limit to 2000 characters.'}), 400
+        # Reject rather than trim: rewriting a cut-off section would silently lose content
+        model = app.config['AI_MODEL']
+        content_tokens = count_tokens(content, model)
+        budget = app.config['SUGGEST_INPUT_TOKEN_BUDGET']
+        if content_tokens > budget:
+            return jsonify({'error': f'Content too long ({content_tokens} tokens). Please shorten it to under {budget} tokens (about {budget * 3 // 4} words).'}), 400
 
         # Enhanced prompts with better instructions
         prompts = {
@@ -219,16 +371,25 @@ Original: {content}"""
         }
 
         prompt = prompts.get(section, f"Improve this {section} section for a professional resume:\n\n{content}")
+        messages = [
+            {"role": "system", "content": "You are a professional resume writer specializing in ATS-optimized content and modern hiring practices. Always follow the specific formatting instructions provided."},
+            {"role": "user", "content": prompt}
+        ]
+
+        # Rewrites are roughly as long as the original, so size the reply to the input
+        prompt_tokens = count_message_tokens(messages, model)
+        max_tokens = pick_max_tokens(
+            prompt_tokens,
+            min(app.config['SUGGEST_MAX_TOKENS'], content_tokens * 2 + 128)
+        )
 
         response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are a professional resume writer specializing in ATS-optimized content and modern hiring practices. Always follow the specific formatting instructions provided."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=300,
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
             temperature=0.4
         )
+        log_token_usage('ai_suggest', prompt_tokens, max_tokens, response)
 
         suggestion = response.choices[0].message.content.strip()
         return jsonify({'suggestion': suggestion})
@@ -240,6 +401,171 @@ Original: {content}"""
         print(f"AI suggestion error: {str(e)}")
         return jsonify({'error': f'Error generating suggestion: {str(e)}'}), 500
 
+# ===== PROMPT PREPARATION =====
+
+PAGE_NUMBER_RE = re.compile(r'^(page\s*)?\d{1,3}(\s*(of|/)\s*\d{1,3})?$', re.IGNORECASE)
+INLINE_SPACE_RE = re.compile(r'[ \t\f\v\u00a0\u2000-\u200b\u3000]+')
+
+def normalize_prompt_text(text):
+    """Compact resume text before it is sent to the model
+
+    Collapses runs of inline whitespace, strips lines and squeezes runs of
+    blank lines. Line content itself is never dropped.
+    """
+    lines = [INLINE_SPACE_RE.sub(' ', line).strip()
+             for line in text.replace('\r\n', '\n').replace('\r', '\n').split('\n')]
+
+    cleaned = []
+    for line in lines:
+        if not line and cleaned and not cleaned[-1]:
+            continue
+        cleaned.append(line)
+
+    return '\n'.join(cleaned).strip()
+
+def strip_page_artifacts(pages, edge_lines=1):
+    """Drop running headers/footers and page numbers from per-page text
+
+    Only the first and last non-empty lines of each page are looked at, so
+    repeated job titles or locations in the body are never touched.
+    A line there is dropped if it is a page number, or if the same line
+    (ignoring digits) sits in the same edge slot on at least three pages:
+    every page, or every page but the first. Two-page documents only lose
+    page numbers, since a shared last line there is as likely to be content.
+    The first copy is kept since it is often the name.
+    """
+    page_lines = [page.replace('\r\n', '\n').split('\n') for page in pages]
+
+    def edge_key(line):
+        return re.sub(r'\d+', '#', INLINE_SPACE_RE.sub(' ', line).strip().lower())
+
+    # Map each page's edge slots (0, 1, ... from the top; -1, -2, ... from the bottom) to line indexes
+    page_slots = []
+    for lines in page_lines:
+        filled = [i for i, line in enumerate(lines) if line.strip()]
+        slots = {}
+        for offset in range(min(edge_lines, len(filled))):
+            slots[-offset - 1] = filled[-offset - 1]
+            slots[offset] = filled[offset]
+        page_slots.append(slots)
+
+    repeated = set()
+    if len(pages) >= 3:
+        for slot in range(-edge_lines, edge_lines):
+            keys = [edge_key(lines[slots[slot]]) if slot in slots else None
+                    for lines, slots in zip(page_lines, page_slots)]
+            for key in set(keys) - {None}:
+                on_every_page = keys.count(key) == len(keys)
+                on_every_later_page = len(keys) > 3 and keys[1:].count(key) == len(keys) - 1
+                if on_every_page or on_every_later_page:
+                    repeated.add((slot, key))
+
+    cleaned = []
+    seen = set()
+    for lines, slots in zip(page_lines, page_slots):
+        drop = set()
+        for slot, i in slots.items():
+            key = (slot, edge_key(lines[i]))
+            if PAGE_NUMBER_RE.match(lines[i].strip()) or (key in repeated and key in seen):
+                drop.add(i)
+            seen.add(key)
+        cleaned.append('\n'.join(line for i, line in enumerate(lines) if i not in drop))
+    return cleaned
+
+TOKEN_ENCODINGS = {}
+TOKEN_ENCODING_FAILURES = {}
+TOKEN_ENCODING_RETRY_SECONDS = 300
+
+def get_token_encoding(model):
+    """Get the tiktoken encoding for a model, or None if unavailable
+
+    Loaded encodings are kept for the life of the worker. A failed load
+    (tiktoken fetches its BPE files on first use) is retried at most every
+    TOKEN_ENCODING_RETRY_SECONDS rather than on every call or never again.
+    """
+    encoding = TOKEN_ENCODINGS.get(model)
+    if encoding is not None or tiktoken is None:
+        return encoding
+
+    failed_at = TOKEN_ENCODING_FAILURES.get(model)
+    if failed_at is not None and time.monotonic() - failed_at < TOKEN_ENCODING_RETRY_SECONDS:
+        return None
+
+    try:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding('cl100k_base')
+    except Exception as e:
+        print(f"Token encoding unavailable, estimating instead: {e}")
+        TOKEN_ENCODING_FAILURES[model] = time.monotonic()
+        return None
+
+    TOKEN_ENCODINGS[model] = encoding
+    TOKEN_ENCODING_FAILURES.pop(model, None)
+    return encoding
+
+# Load the token encoding up front so the first LLM request doesn't pay for it
+get_token_encoding(app.config['AI_MODEL'])
+
+def count_tokens(text, model):
+    """Count tokens locally, falling back to a ~4 chars/token estimate"""
+    encoding = get_token_encoding(model)
+    if encoding is None:
+        return (len(text) + 3) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+def count_message_tokens(messages, model):
+    """Count prompt tokens for a chat request, including per-message overhead"""
+    return sum(count_tokens(m['content'], model) + 4 for m in messages) + 3
+
+def cut_to_tokens(text, budget, model):
+    """Cut a single piece of text to at most budget tokens"""
+    encoding = get_token_encoding(model)
+    if encoding is None:
+        return text[:budget * 4]
+    return encoding.decode(encoding.encode(text, disallowed_special=())[:budget])
+
+def trim_to_token_budget(text, budget, model):
+    """Trim text to at most budget tokens (marker included), cutting on line boundaries"""
+    if count_tokens(text, model) <= budget:
+        return text
+
+    marker = '\n[...truncated]'
+    content_budget = max(0, budget - count_tokens(marker, model))
+
+    kept = []
+    used = 0
+    for line in text.split('\n'):
+        line_tokens = count_tokens(line, model) + 1
+        if used + line_tokens > content_budget:
+            break
+        kept.append(line)
+        used += line_tokens
+
+    if not kept:
+        # A single oversized line: cut it by tokens
+        kept.append(cut_to_tokens(text.split('\n')[0], content_budget, model))
+
+    # Tokens can merge differently across line joins; back off until it fits
+    while kept and count_tokens('\n'.join(kept) + marker, model) > budget:
+        kept.pop()
+    return '\n'.join(kept) + marker
+
+def pick_max_tokens(prompt_tokens, preferred, floor=64):
+    """Pick a completion size that fits in what's left of the context window"""
+    available = app.config['AI_CONTEXT_WINDOW'] - prompt_tokens
+    return max(floor, min(preferred, available))
+
+def log_token_usage(route, prompt_tokens, max_tokens, response):
+    """Log estimated and billed token usage for an LLM call"""
+    usage = getattr(response, 'usage', None)
+    if usage:
+        print(f"[{route}] tokens: prompt={usage.prompt_tokens} (est {prompt_tokens}) "
+              f"completion={usage.completion_tokens}/{max_tokens} total={usage.total_tokens}")
+    else:
+        print(f"[{route}] tokens: prompt~{prompt_tokens} max_completion={max_tokens}")
+
 # ===== RESUME REVIEWER =====
 
 @app.route('/reviewer', methods=['GET', 'POST'])
@@ -257,6 +583,18 @@ def reviewer():
             if not client:
                 return render_template('reviewer.html', error="AI service temporarily unavailable. Please try again later.")
 
+            # Strip extraction noise and keep the resume within the prompt budget;
+            # pasted PDF text keeps its page breaks as form feeds
+            model = app.config['AI_MODEL']
+            review_text = resume_text
+            if '\f' in review_text:
+                review_text = '\n'.join(strip_page_artifacts(review_text.split('\f')))
+            review_text = trim_to_token_budget(
+                normalize_prompt_text(review_text),
+                app.config['REVIEW_INPUT_TOKEN_BUDGET'],
+                model
+            )
+
             # Enhanced AI prompt for comprehensive review
             review_prompt = f"""As an expert resume reviewer and ATS specialist, analyze this resume and provide a detailed review in the following format:
 
@@ -284,18 +622,23 @@ ACTION ITEMS:
 4. [Specific improvement #4]
 
 Resume to analyze:
-{resume_text}
+{review_text}
 """
+            messages = [
+                {"role": "system", "content": "You are an expert resume reviewer specializing in ATS optimization and modern hiring practices. Provide detailed, actionable feedback."},
+                {"role": "user", "content": review_prompt}
+            ]
+
+            prompt_tokens = count_message_tokens(messages, model)
+            max_tokens = pick_max_tokens(prompt_tokens, app.config['REVIEW_MAX_TOKENS'])
 
             response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert resume reviewer specializing in ATS optimization and modern hiring practices. Provide detailed, actionable feedback."},
-                    {"role": "user", "content": review_prompt}
-                ],
-                max_tokens=800,
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
                 temperature=0.3
             )
+            log_token_usage('reviewer', prompt_tokens, max_tokens, response)
 
             feedback = response.choices[0].message.content
 
@@ -348,8 +691,8 @@ def upload_resume():
         if file_ext == '.pdf':
             try:
                 pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text_content += page.extract_text() + "\n"
+                pages = [page.extract_text() or '' for page in pdf_reader.pages]
+                text_content = '\n'.join(strip_page_artifacts(pages))
             except Exception as e:
                 return jsonify({'error': 'Error reading PDF file. Please try a different file.'}), 400
                 
@@ -382,10 +725,6 @@ def download_report():
         if not analysis:
             return jsonify({'error': 'No analysis found. Please analyze a resume first.'}), 404
 
-        # Create PDF in memory
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=1*inch, bottomMargin=1*inch)
-
         # Enhanced styles
         styles = getSampleStyleSheet()
         title_style = ParagraphStyle(
@@ -425,15 +764,12 @@ def download_report():
         # Resume Text Section
         story.append(Paragraph("ANALYZED RESUME", heading_style))
         resume_text = analysis['resume_text'][:1000] + "..." if len(analysis['resume_text']) > 1000 else analysis['resume_text']
-        story.append(Paragraph(resume_text, normal_style))
+        story.append(Paragraph(escape(resume_text), normal_style))
         story.append(Spacer(1, 20))
 
         # Analysis Section
         story.append(Paragraph("DETAILED ANALYSIS", heading_style))
-        feedback_lines = analysis['feedback'].split('\n')
-        for line in feedback_lines:
-            if line.strip():
-                story.append(Paragraph(line.strip(), normal_style))
+        add_feedback_blocks(story, analysis['feedback'], normal_style, styles['Italic'])
 
         story.append(Spacer(1, 30))
 
@@ -441,14 +777,13 @@ def download_report():
         story.append(Paragraph("This report was generated by AI Resume Builder - Visit us for more tools!", styles['Italic']))
 
         # Build PDF
-        doc.build(story)
-        buffer.seek(0)
+        pdf_file, pdf_size = render_pdf(story, topMargin=1*inch, bottomMargin=1*inch)
 
-        return send_file(
-            buffer,
-            as_attachment=True,
-            download_name=f"Resume_Analysis_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-            mimetype='application/pdf'
+        return stream_export(
+            pdf_file,
+            pdf_size,
+            f"Resume_Analysis_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+            'application/pdf'
         )
 
     except Exception as e:
@@ -465,84 +800,73 @@ def export_pdf():
             return jsonify({'error': 'No resume data provided'}), 400
 
         template = resume_data.get('template', 'classic')
+        name = resume_data.get('name', 'Your Name')
 
-        # Create PDF in memory
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
-
-        # Template-specific styles
-        styles = getSampleStyleSheet()
-        title_style, heading_style = get_template_styles(template, styles)
+        pdf_file, pdf_size = run_export('pdf', build_resume_pdf, resume_data)
 
-        normal_style = styles['Normal']
-        normal_style.fontSize = 10
+        return stream_export(
+            pdf_file,
+            pdf_size,
+            f"{name.replace(' ', '_')}_Resume_{template.title()}.pdf",
+            'application/pdf'
+        )
 
-        # Build PDF content
-        story = []
+    except FutureTimeoutError:
+        print("PDF Export Error: timed out")
+        return jsonify({'error': 'PDF generation timed out. Please try again.'}), 504
+    except Exception as e:
+        print(f"PDF Export Error: {str(e)}")
+        return jsonify({'error': f'Error generating PDF: {str(e)}'}), 500
 
-        # Header
-        name = resume_data.get('name', 'Your Name')
-        title = resume_data.get('title', '')
-        
-        story.append(Paragraph(name, title_style))
-        if title:
-            story.append(Paragraph(title, styles['Heading3']))
-        story.append(Spacer(1, 12))
+def build_resume_pdf(resume_data):
+    """Render a resume payload to PDF, returning (file, size)"""
+    template = resume_data.get('template', 'classic')
+    name = resume_data.get('name', 'Your Name')
 
-        # Enhanced Contact Info
-        contact_info = []
-        contact_fields = ['email', 'phone', 'location', 'linkedin', 'website', 'github']
-        
-        for field in contact_fields:
-            if resume_data.get(field):
-                if field in ['linkedin', 'website', 'github']:
-                    contact_info.append(f"{field.title()}: {resume_data[field]}")
-                else:
-                    contact_info.append(resume_data[field])
-
-        if contact_info:
-            # Split contact info into multiple lines if too long
-            if len(' | '.join(contact_info)) > 100:
-                for i in range(0, len(contact_info), 3):
-                    story.append(Paragraph(' | '.join(contact_info[i:i+3]), normal_style))
-            else:
-                story.append(Paragraph(' | '.join(contact_info), normal_style))
-        story.append(Spacer(1, 12))
+    # Template-specific styles
+    styles = getSampleStyleSheet()
+    title_style, heading_style = get_template_styles(template, styles)
 
-        # Summary
-        if resume_data.get('summary'):
-            story.append(Paragraph('PROFESSIONAL SUMMARY', heading_style))
-            story.append(Paragraph(resume_data['summary'], normal_style))
-            story.append(Spacer(1, 12))
+    normal_style = styles['Normal']
+    normal_style.fontSize = 10
 
-        # Dynamic Experience Section
-        add_experience_section(story, resume_data, heading_style, normal_style)
+    # Build PDF content
+    story = []
 
-        # Dynamic Projects Section
-        add_projects_section(story, resume_data, heading_style, normal_style)
+    # Header
+    title = resume_data.get('title', '')
+    
+    story.append(Paragraph(name, title_style))
+    if title:
+        story.append(Paragraph(title, styles['Heading3']))
+    story.append(Spacer(1, 12))
+
+    # Enhanced Contact Info
+    for line in format_contact_lines(resume_data):
+        story.append(Paragraph(line, normal_style))
+    story.append(Spacer(1, 12))
+
+    # Summary
+    if resume_data.get('summary'):
+        story.append(Paragraph('PROFESSIONAL SUMMARY', heading_style))
+        story.append(Paragraph(resume_data['summary'], normal_style))
+        story.append(Spacer(1, 12))
 
-        # Dynamic Education Section
-        add_education_section(story, resume_data, heading_style, normal_style)
+    # Dynamic Experience Section
+    add_experience_section(story, resume_data, heading_style, normal_style)
 
-        # Skills
-        if resume_data.get('skills'):
-            story.append(Paragraph('SKILLS', heading_style))
-            story.append(Paragraph(resume_data['skills'], normal_style))
+    # Dynamic Projects Section
+    add_projects_section(story, resume_data, heading_style, normal_style)
 
-        # Build PDF
-        doc.build(story)
-        buffer.seek(0)
+    # Dynamic Education Section
+    add_education_section(story, resume_data, heading_style, normal_style)
 
-        return send_file(
-            buffer,
-            as_attachment=True,
-            download_name=f"{name.replace(' ', '_')}_Resume_{template.title()}.pdf",
-            mimetype='application/pdf'
-        )
+    # Skills
+    if resume_data.get('skills'):
+        story.append(Paragraph('SKILLS', heading_style))
+        story.append(Paragraph(resume_data['skills'], normal_style))
 
-    except Exception as e:
-        print(f"PDF Export Error: {str(e)}")
-        return jsonify({'error': f'Error generating PDF: {str(e)}'}), 500
+    return render_pdf(story, topMargin=0.5*inch, bottomMargin=0.5*inch)
 
 def get_template_styles(template, styles):
     """Get template-specific styles for PDF generation"""
@@ -694,20 +1018,7 @@ def add_education_section(story, resume_data, heading_style, normal_style):
                     story.append(Paragraph(f"<b>{edu['school']}</b>", normal_style))
 
                 # Date, Location, GPA
-                details = []
-                if edu.get('graduationDate'):
-                    try:
-                        grad_date = datetime.strptime(edu['graduationDate'] + '-01', '%Y-%m-%d')
-                        details.append(grad_date.strftime('%b %Y'))
-                    except:
-                        details.append(edu['graduationDate'])
-
-                if edu.get('location'):
-                    details.append(edu['location'])
-
-                if edu.get('gpa') and float(edu['gpa']) >= 3.5:
-                    details.append(f"GPA: {edu['gpa']}")
-
+                details = format_education_details(edu)
                 if details:
                     story.append(Paragraph(' | '.join(details), normal_style))
 
@@ -718,6 +1029,40 @@ def add_education_section(story, resume_data, heading_style, normal_style):
                 story.append(Spacer(1, 8))
         story.append(Spacer(1, 4))
 
+def format_contact_lines(resume_data):
+    """Format contact fields, splitting into lines of three if too long"""
+    contact_info = []
+    contact_fields = ['email', 'phone', 'location', 'linkedin', 'website', 'github']
+
+    for field in contact_fields:
+        if resume_data.get(field):
+            if field in ['linkedin', 'website', 'github']:
+                contact_info.append(f"{field.title()}: {resume_data[field]}")
+            else:
+                contact_info.append(resume_data[field])
+
+    if len(' | '.join(contact_info)) > 100:
+        return [' | '.join(contact_info[i:i+3]) for i in range(0, len(contact_info), 3)]
+    return [' | '.join(contact_info)] if contact_info else []
+
+def format_education_details(edu):
+    """Format graduation date, location and GPA for an education entry"""
+    details = []
+    if edu.get('graduationDate'):
+        try:
+            grad_date = datetime.strptime(edu['graduationDate'] + '-01', '%Y-%m-%d')
+            details.append(grad_date.strftime('%b %Y'))
+        except:
+            details.append(edu['graduationDate'])
+
+    if edu.get('location'):
+        details.append(edu['location'])
+
+    if edu.get('gpa') and float(edu['gpa']) >= 3.5:
+        details.append(f"GPA: {edu['gpa']}")
+
+    return details
+
 def format_date_range(entry):
     """Format date range for entries"""
     date_range = ''
@@ -740,6 +1085,350 @@ def format_date_range(entry):
     
     return date_range
 
+# ===== DOCX EXPORT =====
+
+DOCX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+DOCX_TEMPLATE_STYLES = {
+    'classic': {'color': '1E40AF', 'title_size': 18, 'title_after': 12, 'heading_size': 12,
+                'heading_after': 6, 'heading_border': True},
+    'modern': {'color': '3B82F6', 'title_size': 20, 'title_after': 16, 'heading_size': 13,
+               'heading_after': 8, 'heading_shading': 'EFF6FF'},
+    'creative': {'color': '06B6D4', 'title_size': 22, 'title_after': 18, 'heading_size': 14,
+                 'heading_after': 10, 'heading_indent': 10},
+}
+
+@app.route('/export_docx', methods=['POST'])
+def export_docx():
+    try:
+        resume_data = request.json
+        if not resume_data:
+            return jsonify({'error': 'No resume data provided'}), 400
+
+        template = resume_data.get('template', 'classic')
+        name = resume_data.get('name', 'Your Name')
+
+        docx_file, docx_size = run_export('docx', build_resume_docx, resume_data)
+
+        return stream_export(
+            docx_file,
+            docx_size,
+            f"{name.replace(' ', '_')}_Resume_{template.title()}.docx",
+            DOCX_MIMETYPE
+        )
+
+    except FutureTimeoutError:
+        print("DOCX Export Error: timed out")
+        return jsonify({'error': 'DOCX generation timed out. Please try again.'}), 504
+    except Exception as e:
+        print(f"DOCX Export Error: {str(e)}")
+        return jsonify({'error': f'Error generating DOCX: {str(e)}'}), 500
+
+@lru_cache(maxsize=None)
+def get_docx_template(template):
+    """Build the styled base document for a template once; callers clone it
+
+    Only call with a key of DOCX_TEMPLATE_STYLES (see resolve_docx_template),
+    so the cache stays bounded to one document per template.
+    """
+    spec = DOCX_TEMPLATE_STYLES[template]
+    color = RGBColor.from_string(spec['color'])
+    document = docx.Document()
+
+    for section in document.sections:
+        section.top_margin = section.bottom_margin = Inches(0.5)
+
+    normal = document.styles['Normal']
+    normal.font.size = Pt(10)
+    normal.paragraph_format.space_after = Pt(2)
+
+    title_style = document.styles.add_style('Resume Title', WD_STYLE_TYPE.PARAGRAPH)
+    title_style.base_style = normal
+    title_style.font.size = Pt(spec['title_size'])
+    title_style.font.bold = True
+    title_style.font.color.rgb = color
+    title_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    title_style.paragraph_format.space_after = Pt(spec['title_after'])
+
+    subtitle_style = document.styles.add_style('Resume Subtitle', WD_STYLE_TYPE.PARAGRAPH)
+    subtitle_style.base_style = normal
+    subtitle_style.font.size = Pt(12)
+    subtitle_style.font.bold = True
+    subtitle_style.paragraph_format.space_after = Pt(6)
+
+    heading_style = document.styles.add_style('Resume Heading', WD_STYLE_TYPE.PARAGRAPH)
+    heading_style.base_style = normal
+    heading_style.font.size = Pt(spec['heading_size'])
+    heading_style.font.bold = True
+    heading_style.font.color.rgb = color
+
+    # Borders and shading go in first so later pPr children keep schema order
+    ppr = heading_style.element.get_or_add_pPr()
+    if spec.get('heading_border'):
+        borders = OxmlElement('w:pBdr')
+        for edge in ('top', 'left', 'bottom', 'right'):
+            border = OxmlElement(f'w:{edge}')
+            border.set(qn('w:val'), 'single')
+            border.set(qn('w:sz'), '8')
+            border.set(qn('w:space'), '3')
+            border.set(qn('w:color'), spec['color'])
+            borders.append(border)
+        ppr.append(borders)
+    if spec.get('heading_shading'):
+        shading = OxmlElement('w:shd')
+        shading.set(qn('w:val'), 'clear')
+        shading.set(qn('w:color'), 'auto')
+        shading.set(qn('w:fill'), spec['heading_shading'])
+        ppr.append(shading)
+
+    heading_style.paragraph_format.space_before = Pt(10)
+    heading_style.paragraph_format.space_after = Pt(spec['heading_after'])
+    heading_style.paragraph_format.keep_with_next = True
+    if spec.get('heading_indent'):
+        heading_style.paragraph_format.left_indent = Pt(spec['heading_indent'])
+
+    return document
+
+XML_LINE_BREAK_RE = re.compile(r'\r\n?|[\x0b\x0c]')
+XML_INVALID_RE = re.compile('[\x00-\x08\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+
+def clean_docx_value(value):
+    """Make payload strings XML-safe for python-docx, recursing into lists and dicts
+
+    Vertical tabs (Word soft breaks) and form feeds become newlines; other
+    control characters are dropped.
+    """
+    if isinstance(value, str):
+        return XML_INVALID_RE.sub('', XML_LINE_BREAK_RE.sub('\n', value))
+    if isinstance(value, list):
+        return [clean_docx_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: clean_docx_value(item) for key, item in value.items()}
+    return value
+
+def resolve_docx_template(template):
+    """Map a requested template name to a known style, defaulting to creative like the PDF path"""
+    if isinstance(template, str) and template in DOCX_TEMPLATE_STYLES:
+        return template
+    return 'creative'
+
+def add_docx_text(document, text):
+    """Add a paragraph, keeping line breaks within the text"""
+    paragraph = document.add_paragraph()
+    for i, line in enumerate(text.split('\n')):
+        if i:
+            paragraph.runs[-1].add_break()
+        paragraph.add_run(line)
+    return paragraph
+
+def add_docx_entry(document, primary, secondary, details, description):
+    """Add a section entry: bold title line, details line and description"""
+    paragraph = document.add_paragraph()
+    paragraph.add_run(primary or secondary).bold = True
+    if primary and secondary:
+        paragraph.add_run(f" - {secondary}")
+    if details:
+        paragraph = document.add_paragraph(' | '.join(details))
+    if description:
+        paragraph = add_docx_text(document, description)
+    paragraph.paragraph_format.space_after = Pt(8)
+
+def build_resume_docx(resume_data):
+    """Render a resume payload to DOCX, returning (file, size)"""
+    resume_data = clean_docx_value(resume_data)
+    template = resume_data.get('template', 'classic')
+    document = copy.deepcopy(get_docx_template(resolve_docx_template(template)))
+
+    # Resolve styles once; looking them up by name scans the whole style table
+    title_style = document.styles['Resume Title']
+    subtitle_style = document.styles['Resume Subtitle']
+    heading_style = document.styles['Resume Heading']
+
+    # Header
+    document.add_paragraph(resume_data.get('name', 'Your Name'), style=title_style)
+    if resume_data.get('title'):
+        document.add_paragraph(resume_data['title'], style=subtitle_style)
+    for line in format_contact_lines(resume_data):
+        document.add_paragraph(line)
+
+    if resume_data.get('summary'):
+        document.add_paragraph('PROFESSIONAL SUMMARY', style=heading_style)
+        add_docx_text(document, resume_data['summary'])
+
+    experience = [exp for exp in resume_data.get('experience') or []
+                  if isinstance(exp, dict) and (exp.get('company') or exp.get('position'))]
+    if experience:
+        document.add_paragraph('WORK EXPERIENCE', style=heading_style)
+        for exp in experience:
+            details = [d for d in (format_date_range(exp), exp.get('location')) if d]
+            add_docx_entry(document, exp.get('position'), exp.get('company'), details, exp.get('description'))
+
+    projects = [project for project in resume_data.get('projects') or []
+                if isinstance(project, dict) and project.get('name')]
+    if projects:
+        document.add_paragraph('PROJECTS', style=heading_style)
+        for project in projects:
+            details = []
+            if project.get('technologies'):
+                details.append(f"Technologies: {project['technologies']}")
+            if format_date_range(project):
+                details.append(format_date_range(project))
+            add_docx_entry(document, project['name'], None, details, project.get('description'))
+
+            links = []
+            if project.get('githubUrl'):
+                links.append(f"GitHub: {project['githubUrl']}")
+            if project.get('demoUrl'):
+                links.append(f"Demo: {project['demoUrl']}")
+            if links:
+                document.add_paragraph(' | '.join(links)).paragraph_format.space_after = Pt(8)
+
+    education = [edu for edu in resume_data.get('education') or []
+                 if isinstance(edu, dict) and (edu.get('degree') or edu.get('school'))]
+    if education:
+        document.add_paragraph('EDUCATION', style=heading_style)
+        for edu in education:
+            add_docx_entry(document, edu.get('degree'), edu.get('school'),
+                           format_education_details(edu), edu.get('description'))
+
+    if resume_data.get('skills'):
+        document.add_paragraph('SKILLS', style=heading_style)
+        add_docx_text(document, resume_data['skills'])
+
+    docx_file = tempfile.SpooledTemporaryFile(max_size=app.config['EXPORT_SPOOL_MAX_MEMORY'])
+    try:
+        document.save(docx_file)
+        docx_size = docx_file.tell()
+        docx_file.seek(0)
+    except Exception:
+        docx_file.close()
+        raise
+    return docx_file, docx_size
+
+# ===== EXPORT PIPELINE =====
+
+EXPORT_POOL = ThreadPoolExecutor(max_workers=app.config['EXPORT_WORKERS'], thread_name_prefix='export')
+EXPORT_CACHE = OrderedDict()
+EXPORT_CACHE_LOCK = threading.Lock()
+EXPORT_CACHE_BYTES = 0
+
+def run_export(export_format, renderer, resume_data):
+    """Render an export on the worker pool, reusing cached output when possible
+
+    Returns (file, size). Identical payloads for the same format are served
+    from a small LRU cache instead of being rendered again. Only results up to
+    EXPORT_CACHE_MAX_ITEM_BYTES are kept, within EXPORT_CACHE_MAX_BYTES total.
+    """
+    global EXPORT_CACHE_BYTES
+    max_bytes = app.config['EXPORT_CACHE_MAX_BYTES']
+    key = hashlib.sha256(
+        (export_format + json.dumps(resume_data, sort_keys=True, default=str)).encode('utf-8')
+    ).hexdigest()
+
+    if max_bytes:
+        with EXPORT_CACHE_LOCK:
+            cached = EXPORT_CACHE.get(key)
+            if cached is not None:
+                EXPORT_CACHE.move_to_end(key)
+                return io.BytesIO(cached), len(cached)
+
+    future = EXPORT_POOL.submit(renderer, resume_data)
+    try:
+        export_file, export_size = future.result(timeout=app.config['EXPORT_TIMEOUT'])
+    except FutureTimeoutError:
+        # Drop it if still queued; otherwise close the file whenever it finishes
+        if not future.cancel():
+            future.add_done_callback(close_abandoned_export)
+        raise
+
+    if max_bytes and export_size <= min(max_bytes, app.config['EXPORT_CACHE_MAX_ITEM_BYTES']):
+        body = export_file.read()
+        export_file.seek(0)
+        with EXPORT_CACHE_LOCK:
+            if key not in EXPORT_CACHE:
+                EXPORT_CACHE[key] = body
+                EXPORT_CACHE_BYTES += len(body)
+            while EXPORT_CACHE_BYTES > max_bytes:
+                _, evicted = EXPORT_CACHE.popitem(last=False)
+                EXPORT_CACHE_BYTES -= len(evicted)
+
+    return export_file, export_size
+
+def close_abandoned_export(future):
+    """Close the output of a render that finished after its request gave up"""
+    if not future.cancelled() and future.exception() is None:
+        future.result()[0].close()
+
+def render_pdf(story, **doc_kwargs):
+    """Build a PDF into a spooled temp file and return (file, size)
+
+    Small documents stay in memory; anything past EXPORT_SPOOL_MAX_MEMORY spills
+    to disk so concurrent downloads don't each pin a full PDF in the worker.
+    """
+    pdf_file = tempfile.SpooledTemporaryFile(max_size=app.config['EXPORT_SPOOL_MAX_MEMORY'])
+    try:
+        doc = SimpleDocTemplate(pdf_file, pagesize=letter, **doc_kwargs)
+        doc.build(story)
+        pdf_size = pdf_file.tell()
+        pdf_file.seek(0)
+    except Exception:
+        pdf_file.close()
+        raise
+    return pdf_file, pdf_size
+
+def stream_export(export_file, export_size, download_name, mimetype):
+    """Stream a rendered export back in chunks with an explicit Content-Length"""
+    chunk_size = app.config['EXPORT_STREAM_CHUNK_SIZE']
+
+    def generate():
+        try:
+            while True:
+                chunk = export_file.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            export_file.close()
+
+    response = Response(generate(), mimetype=mimetype, direct_passthrough=True)
+    response.headers['Content-Length'] = str(export_size)
+    # ASCII-safe filename for old clients, RFC 5987 filename* for the real name
+    names = {'filename': secure_filename(download_name) or 'download'}
+    if not download_name.isascii():
+        names['filename*'] = f"UTF-8''{quote(download_name, safe='!#$&+-.^_`|~')}"
+    response.headers.set('Content-Disposition', 'attachment', **names)
+    response.call_on_close(export_file.close)
+    return response
+
+def add_feedback_blocks(story, feedback, normal_style, note_style):
+    """Add AI feedback to the report, merging consecutive lines into one flowable
+
+    Lines between blank lines become a single Paragraph (joined with <br/>),
+    which keeps the story small. The story is capped at REPORT_MAX_FLOWABLES.
+    """
+    max_flowables = app.config['REPORT_MAX_FLOWABLES']
+    lines_per_block = app.config['REPORT_LINES_PER_BLOCK']
+    block = []
+
+    def flush():
+        if block:
+            story.append(Paragraph('<br/>'.join(block), normal_style))
+            block.clear()
+
+    for line in feedback.split('\n'):
+        if len(story) >= max_flowables:
+            block.clear()
+            story.append(Paragraph('Analysis truncated for length.', note_style))
+            return
+        line = line.strip()
+        if not line:
+            flush()
+            continue
+        block.append(escape(line))
+        if len(block) >= lines_per_block:
+            flush()
+    flush()
+
 # ===== UTILITY ROUTES =====
 
 @app.route('/health')
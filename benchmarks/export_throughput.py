@@ -0,0 +1,73 @@
+"""Export throughput benchmark: DOCX against PDF.
+
+Renders the same synthetic resumes through /export_pdf and /export_docx from
+several client threads (so the export worker pool is exercised) with the
+export cache disabled, and reports exports per second for each format.
+
+    python benchmarks/export_throughput.py [--entries 10] [--exports 60] [--threads 4]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import synthetic  # noqa: E402
+
+
+def throughput(app, route, payload, exports, threads):
+    """Run `exports` requests across `threads` clients; return exports per second"""
+    def worker(count):
+        client = app.test_client()
+        for _ in range(count):
+            response = client.post(route, json=payload)
+            if response.status_code != 200:
+                raise RuntimeError(f"{route} returned {response.status_code}")
+            response.get_data()
+            response.close()
+
+    per_thread = [exports // threads + (i < exports % threads) for i in range(threads)]
+    worker(1)  # warm up
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, per_thread))
+    return exports / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--entries', type=int, default=10)
+    parser.add_argument('--exports', type=int, default=60)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--output', help='write results JSON to this path')
+    args = parser.parse_args()
+
+    # Resolve the output path before moving filesystem sessions out of the working tree
+    args.output = os.path.abspath(args.output) if args.output else None
+    os.chdir(tempfile.mkdtemp(prefix='resumebuilder-bench-'))
+    from app import app
+
+    app.config['EXPORT_CACHE_MAX_BYTES'] = 0
+    results = {}
+    for template in synthetic.TEMPLATES:
+        payload = synthetic.resume_payload(args.entries, template)
+        pdf = throughput(app, '/export_pdf', payload, args.exports, args.threads)
+        docx_rate = throughput(app, '/export_docx', payload, args.exports, args.threads)
+        results[template] = {'pdf_per_sec': pdf, 'docx_per_sec': docx_rate, 'docx_vs_pdf': docx_rate / pdf}
+        print(f"{template:<10} pdf {pdf:7.1f}/s  docx {docx_rate:7.1f}/s  docx/pdf x{docx_rate / pdf:.2f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'entries': args.entries, 'exports': args.exports,
+                       'threads': args.threads, 'results': results}, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""Peak memory benchmark for PDF downloads.
+
+Covers /download_report (by feedback lines) and /export_pdf (by resume
+entries, export cache disabled). Each scenario runs in a fresh subprocess so
+ru_maxrss reflects a single download. Exits non-zero if any scenario grows
+peak RSS past the bound.
+
+    python benchmarks/report_memory.py [--max-rss-mb 40]
+"""
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import synthetic  # noqa: E402
+
+
+def run_download(kind, size, queue):
+    # Keep filesystem sessions out of the working tree
+    os.chdir(tempfile.mkdtemp(prefix='resumebuilder-bench-'))
+    from app import app
+
+    app.config['EXPORT_CACHE_MAX_BYTES'] = 0
+    client = app.test_client()
+    if kind == 'download_report':
+        with client.session_transaction() as sess:
+            sess['last_analysis'] = {
+                'resume_text': 'Jane Doe\nSoftware Engineer\n' * 200,
+                'feedback': synthetic.review_feedback(size),
+                'timestamp': 'benchmark',
+            }
+
+    def download():
+        if kind == 'download_report':
+            return client.get('/download_report')
+        return client.post('/export_pdf', json=synthetic.resume_payload(size))
+
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    response = download()
+    body_size = sum(len(chunk) for chunk in response.response)
+    response.close()
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((response.status_code, body_size, (after - before) / 1024))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--max-rss-mb', type=float, default=40.0)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context('spawn')
+    failed = False
+    scenarios = [('download_report', lines, 'lines') for lines in (10, 100, 1000, 10000)]
+    scenarios += [('export_pdf', entries, 'entries') for entries in (1, 10, 100)]
+    for kind, size, unit in scenarios:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=run_download, args=(kind, size, queue))
+        proc.start()
+        status, body_size, rss_mb = queue.get()
+        proc.join()
+        ok = status == 200 and rss_mb <= args.max_rss_mb
+        failed = failed or not ok
+        print(f"{kind:<16} {size:>6} {unit:<8} status={status}  pdf={body_size / 1024:.1f} KB  "
+              f"peak RSS +{rss_mb:.1f} MB  {'ok' if ok else 'FAIL'}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
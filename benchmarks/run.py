@@ -0,0 +1,207 @@
+"""Benchmark runner for the app's hot paths.
+
+Times PDF and DOCX export per template, the analysis report download, upload text
+extraction, the session save/load round trip and bare Flask request overhead,
+all through the Flask test client with synthetic data.
+
+    python benchmarks/run.py                         # print results
+    python benchmarks/run.py --output results.json   # also write JSON
+    python benchmarks/run.py --save-baseline         # store benchmarks/baseline.json
+    python benchmarks/run.py --compare               # fail on regressions vs baseline
+
+Use --quick to skip the largest inputs.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import synthetic  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+ENTRY_COUNTS = (1, 10, 100)
+TEXT_SIZES = (1024, 100 * 1024, 1024 * 1024)
+FEEDBACK_LINES = (10, 100, 1000)
+
+
+def read_body(response):
+    """Drain a (possibly streamed) response and return its size"""
+    size = len(response.get_data())
+    response.close()
+    return size
+
+
+def check(response, expected=200):
+    if response.status_code != expected:
+        raise RuntimeError(f"unexpected status {response.status_code}: {response.get_data()[:200]!r}")
+    return read_body(response)
+
+
+def collect_benchmarks(app, client, quick=False):
+    """Return (name, callable) pairs; each callable performs one measured operation"""
+    from app import asset_url
+
+    entry_counts = ENTRY_COUNTS[:-1] if quick else ENTRY_COUNTS
+    text_sizes = TEXT_SIZES[:-1] if quick else TEXT_SIZES
+    benchmarks = []
+
+    for template in synthetic.TEMPLATES:
+        for entries in entry_counts:
+            payload = synthetic.resume_payload(entries, template)
+            for export_format in ('pdf', 'docx'):
+                benchmarks.append((
+                    f'export_{export_format}[{template}-{entries}]',
+                    lambda payload=payload, route=f'/export_{export_format}': check(client.post(route, json=payload)),
+                ))
+
+    for lines in FEEDBACK_LINES:
+        for size in text_sizes:
+            analysis = {
+                'resume_text': synthetic.resume_text(size),
+                'feedback': synthetic.review_feedback(lines),
+                'timestamp': 'benchmark',
+            }
+
+            def download(analysis=analysis):
+                with client.session_transaction() as sess:
+                    sess['last_analysis'] = analysis
+                return check(client.get('/download_report'))
+
+            benchmarks.append((f'download_report[{lines}lines-{size // 1024}KB]', download))
+
+    for size in text_sizes:
+        text = synthetic.resume_text(size)
+        for ext, data in (('pdf', synthetic.pdf_fixture(text)), ('docx', synthetic.docx_fixture(text))):
+            def upload(data=data, ext=ext):
+                return check(client.post(
+                    '/upload_resume',
+                    data={'resume_file': (io.BytesIO(data), f'resume.{ext}')},
+                    content_type='multipart/form-data',
+                ))
+
+            benchmarks.append((f'upload_resume[{ext}-{size // 1024}KB]', upload))
+
+    for entries in entry_counts:
+        payload = synthetic.resume_payload(entries)
+
+        def round_trip(payload=payload):
+            check(client.post('/builder', json=payload))
+            return check(client.get('/get_resume_data'))
+
+        benchmarks.append((f'session_round_trip[{entries}]', round_trip))
+
+    benchmarks.append(('request_overhead[health]', lambda: check(client.get('/health'))))
+    benchmarks.append(('request_overhead[home]', lambda: check(client.get('/'))))
+
+    with app.test_request_context():
+        style_url = asset_url('style.css')
+    benchmarks.append(('static_asset[style.css-gzip]', lambda: check(
+        client.get(style_url, headers={'Accept-Encoding': 'gzip'}))))
+    return benchmarks
+
+
+def measure(fn, min_runs=5, max_seconds=2.0, max_runs=1000):
+    """Run fn once to warm up, then at least min_runs times, continuing until max_seconds"""
+    fn()
+    timings = []
+    started = time.perf_counter()
+    while len(timings) < min_runs or (time.perf_counter() - started < max_seconds and len(timings) < max_runs):
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+    return {
+        'runs': len(timings),
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'mean': statistics.fmean(timings),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Print a comparison against baseline; return names that regressed"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base:
+            print(f"  {name:<45} (no baseline)")
+            continue
+        ratio = result['median'] / base['median'] if base['median'] else float('inf')
+        flag = 'REGRESSION' if ratio > 1 + tolerance else ''
+        print(f"  {name:<45} {base['median'] * 1000:9.2f} ms -> {result['median'] * 1000:9.2f} ms  x{ratio:5.2f} {flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--quick', action='store_true', help='skip the largest inputs')
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this')
+    parser.add_argument('--min-runs', type=int, default=5)
+    parser.add_argument('--max-seconds', type=float, default=2.0)
+    parser.add_argument('--export-cache', action='store_true', help='leave the export result cache enabled')
+    parser.add_argument('--output', help='write results JSON to this path')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help='write results to --baseline')
+    parser.add_argument('--compare', action='store_true', help='compare against --baseline and exit 1 on regressions')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown before flagging (0.25 = 25%%)')
+    args = parser.parse_args()
+
+    # Resolve paths before moving filesystem sessions out of the working tree
+    args.output = os.path.abspath(args.output) if args.output else None
+    args.baseline = os.path.abspath(args.baseline)
+    os.chdir(tempfile.mkdtemp(prefix='resumebuilder-bench-'))
+    from app import app
+
+    if not args.export_cache:
+        # Measure rendering, not cache hits on the repeated payloads
+        app.config['EXPORT_CACHE_MAX_BYTES'] = 0
+    client = app.test_client()
+    results = {}
+    for name, fn in collect_benchmarks(app, client, args.quick):
+        if args.filter not in name:
+            continue
+        results[name] = measure(fn, args.min_runs, args.max_seconds)
+        print(f"{name:<45} median {results[name]['median'] * 1000:9.2f} ms  ({results[name]['runs']} runs)")
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'quick': args.quick,
+            'export_cache': args.export_cache,
+        },
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+
+    if args.compare:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"\nComparison against {args.baseline}:")
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
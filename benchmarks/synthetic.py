@@ -0,0 +1,96 @@
+"""Synthetic resume payloads and upload fixtures for the benchmarks."""
+import io
+
+import docx
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph, SimpleDocTemplate
+
+TEMPLATES = ('classic', 'modern', 'creative')
+
+BULLET = "• Led a team of {n} engineers to ship a platform migration, cutting latency by {p}% and costs by ${k}k."
+
+
+def resume_payload(entries, template='classic'):
+    """Build an export_pdf/builder payload with `entries` items per dynamic section."""
+    return {
+        'name': 'Jane Doe',
+        'title': 'Senior Software Engineer',
+        'email': 'jane@example.com',
+        'phone': '555-0100',
+        'location': 'Austin, TX',
+        'linkedin': 'linkedin.com/in/janedoe',
+        'website': 'janedoe.dev',
+        'github': 'github.com/janedoe',
+        'summary': 'Engineer with a decade of experience building reliable distributed systems.',
+        'experience': [{
+            'position': f'Engineer {i}',
+            'company': f'Company {i}',
+            'location': 'Remote',
+            'startDate': '2018-01',
+            'endDate': '2020-06',
+            'current': i == 0,
+            'description': ' '.join(BULLET.format(n=i + 3, p=10 + i % 50, k=i * 5) for _ in range(3)),
+        } for i in range(entries)],
+        'projects': [{
+            'name': f'Project {i}',
+            'technologies': 'Python, Flask, PostgreSQL',
+            'startDate': '2021-02',
+            'endDate': '2021-09',
+            'description': BULLET.format(n=2, p=i % 90, k=i),
+            'githubUrl': f'github.com/janedoe/project-{i}',
+        } for i in range(entries)],
+        'education': [{
+            'degree': f'B.S. Computer Science {i}',
+            'school': 'State University',
+            'graduationDate': '2014-05',
+            'gpa': '3.8',
+            'description': "Dean's list; teaching assistant for algorithms.",
+        } for i in range(entries)],
+        'skills': 'Python, Go, SQL, Kubernetes, AWS, Leadership, Mentoring',
+        'template': template,
+    }
+
+
+def resume_text(size_bytes):
+    """Plain resume-like text of roughly `size_bytes`."""
+    lines = []
+    total = 0
+    i = 0
+    while total < size_bytes:
+        line = BULLET.format(n=i % 20 + 1, p=i % 90, k=i)
+        lines.append(line)
+        total += len(line.encode('utf-8')) + 1
+        i += 1
+    return '\n'.join(lines)
+
+
+def review_feedback(lines):
+    """AI review feedback in the shape the reviewer prompt asks for."""
+    sections = ['STRENGTHS:', 'WEAKNESSES:', 'KEYWORD OPTIMIZATION:', 'ACTION ITEMS:']
+    out = ['OVERALL SCORE: 7/10', '', 'ATS COMPATIBILITY: Medium - dense formatting']
+    for i in range(lines):
+        if i % 8 == 0:
+            out.extend(['', sections[(i // 8) % len(sections)]])
+        out.append(f"• Point {i}: quantify impact & use <stronger> action verbs.")
+    return '\n'.join(out)
+
+
+def pdf_fixture(text):
+    """Render text to PDF bytes, one paragraph per line."""
+    buffer = io.BytesIO()
+    style = getSampleStyleSheet()['Normal']
+    story = [Paragraph(line.replace('&', '&amp;').replace('<', '&lt;'), style)
+             for line in text.split('\n')]
+    SimpleDocTemplate(buffer, pagesize=letter).build(story)
+    return buffer.getvalue()
+
+
+def docx_fixture(text):
+    """Render text to DOCX bytes, one paragraph per line."""
+    document = docx.Document()
+    for line in text.split('\n'):
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
@@ -95,10 +95,12 @@ function initializeFormInputs() {
 // ===== BUTTONS INITIALIZATION =====
 function initializeButtons() {
     const exportBtn = document.getElementById('export-pdf-btn');
+    const exportDocxBtn = document.getElementById('export-docx-btn');
     const saveBtn = document.getElementById('save-btn');
     const clearBtn = document.getElementById('clear-btn');
     
     if (exportBtn) exportBtn.addEventListener('click', exportToPDF);
+    if (exportDocxBtn) exportDocxBtn.addEventListener('click', exportToDOCX);
     if (saveBtn) saveBtn.addEventListener('click', () => {
         if (validateForm()) saveResume();
     });
@@ -1281,11 +1283,6 @@ async function getAISuggestion(section) {
         return;
     }
     
-    if (content.length > 2000) {
-        showMessage('Content too long. Please limit to 2000 characters.', 'error');
-        return;
-    }
-    
     try {
         isProcessing = true;
         textarea.disabled = true;
@@ -1543,6 +1540,14 @@ async function saveResume() {
 }
 
 async function exportToPDF() {
+    await exportResume('pdf', 'PDF');
+}
+
+async function exportToDOCX() {
+    await exportResume('docx', 'Word document');
+}
+
+async function exportResume(format, label) {
     try {
         updatePreview();
         
@@ -1551,9 +1556,9 @@ async function exportToPDF() {
             return;
         }
         
-        showMessage('Generating PDF...', 'info');
+        showMessage(`Generating ${label}...`, 'info');
         
-        const response = await fetch('/export_pdf', {
+        const response = await fetch(`/export_${format}`, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -1571,17 +1576,17 @@ async function exportToPDF() {
         const url = window.URL.createObjectURL(blob);
         const a = document.createElement('a');
         a.href = url;
-        a.download = `${resumeData.name.replace(/[^a-zA-Z0-9]/g, '_')}_Resume_${currentTemplate}.pdf`;
+        a.download = `${resumeData.name.replace(/[^a-zA-Z0-9]/g, '_')}_Resume_${currentTemplate}.${format}`;
         document.body.appendChild(a);
         a.click();
         document.body.removeChild(a);
         window.URL.revokeObjectURL(url);
         
-        showMessage('PDF downloaded successfully!', 'success');
+        showMessage(`${label} downloaded successfully!`, 'success');
         
     } catch (error) {
-        console.error('PDF export error:', error);
-        showMessage(`Error generating PDF: ${error.message}`, 'error');
+        console.error(`${label} export error:`, error);
+        showMessage(`Error generating ${label}: ${error.message}`, 'error');
     }
 }
 
@@ -1724,5 +1729,6 @@ window.getAISuggestion = getAISuggestion;
 window.updatePreview = updatePreview;
 window.saveResume = saveResume;
 window.exportToPDF = exportToPDF;
+window.exportToDOCX = exportToDOCX;
 window.clearAllContent = clearAllContent;
 window.handleSuggestionAction = handleSuggestionAction;
@@ -0,0 +1,115 @@
+import io
+import time
+
+import docx
+import pytest
+
+import app as app_module
+from app import DOCX_MIMETYPE, app
+
+
+@pytest.fixture(autouse=True)
+def empty_export_cache(monkeypatch):
+    monkeypatch.setattr(app_module, 'EXPORT_CACHE', app_module.OrderedDict())
+    monkeypatch.setattr(app_module, 'EXPORT_CACHE_BYTES', 0)
+
+
+def payload(template='classic', **fields):
+    data = {
+        'name': 'Jane Doe',
+        'title': 'Software Engineer',
+        'email': 'jane@example.com',
+        'summary': 'Engineer with ten years of experience.',
+        'experience': [{'position': 'Software Engineer', 'company': 'Acme Corp', 'location': 'Remote',
+                        'startDate': '2019-01', 'current': True, 'description': 'Led a team.'}],
+        'education': [{'degree': 'B.S. Computer Science', 'school': 'State University', 'gpa': '3.8'}],
+        'skills': 'Python, SQL',
+        'template': template,
+    }
+    data.update(fields)
+    return data
+
+
+def export(data):
+    response = app.test_client().post('/export_docx', json=data)
+    body = response.get_data()
+    return response, body
+
+
+@pytest.mark.parametrize('template', ['classic', 'modern', 'creative'])
+def test_export_docx_for_each_template(template):
+    response, body = export(payload(template))
+
+    assert response.status_code == 200
+    assert response.mimetype == DOCX_MIMETYPE
+    assert int(response.headers['Content-Length']) == len(body)
+    assert f'Jane_Doe_Resume_{template.title()}.docx' in response.headers['Content-Disposition']
+
+    document = docx.Document(io.BytesIO(body))
+    texts = [paragraph.text for paragraph in document.paragraphs]
+    assert texts[0] == 'Jane Doe'
+    assert document.paragraphs[0].style.name == 'Resume Title'
+    assert 'WORK EXPERIENCE' in texts
+    assert 'Software Engineer - Acme Corp' in texts
+    assert 'GPA: 3.8' in texts[texts.index('EDUCATION') + 2]
+
+
+def test_unknown_template_does_not_grow_template_cache():
+    for name in ('junk-1', 'junk-2', 'junk-3'):
+        assert export(payload(name))[0].status_code == 200
+
+    assert app_module.get_docx_template.cache_info().currsize <= 3
+
+
+def test_control_characters_are_cleaned():
+    response, body = export(payload(summary='line\x0btwo\x0cthree\x01four\r\nfive', skills='Python\x00, SQL'))
+
+    assert response.status_code == 200
+    texts = [paragraph.text for paragraph in docx.Document(io.BytesIO(body)).paragraphs]
+    assert 'line\ntwo\nthreefour\nfive' in texts
+    assert 'Python, SQL' in texts
+
+
+def test_cache_hit_returns_identical_bytes(monkeypatch):
+    calls = []
+    render = app_module.build_resume_docx
+    monkeypatch.setattr(app_module, 'build_resume_docx', lambda data: calls.append(1) or render(data))
+
+    first = export(payload())[1]
+    second = export(payload())[1]
+
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_cache_is_capped_by_total_bytes(monkeypatch):
+    monkeypatch.setitem(app.config, 'EXPORT_CACHE_MAX_BYTES', 60 * 1024)
+
+    sizes = [len(export(payload(name=f'Person {i}'))[1]) for i in range(5)]
+
+    assert app_module.EXPORT_CACHE_BYTES == sum(len(body) for body in app_module.EXPORT_CACHE.values())
+    assert app_module.EXPORT_CACHE_BYTES <= 60 * 1024
+    assert len(app_module.EXPORT_CACHE) < len(sizes)
+
+
+def test_timeout_returns_504_and_closes_late_file(monkeypatch):
+    monkeypatch.setitem(app.config, 'EXPORT_TIMEOUT', 0.05)
+    monkeypatch.setitem(app.config, 'EXPORT_CACHE_MAX_BYTES', 0)
+    rendered = []
+    render = app_module.build_resume_docx
+
+    def slow_render(data):
+        time.sleep(0.3)
+        rendered.append(render(data)[0])
+        return rendered[-1], 0
+
+    monkeypatch.setattr(app_module, 'build_resume_docx', slow_render)
+
+    response, _ = export(payload())
+
+    assert response.status_code == 504
+    assert 'timed out' in response.get_json()['error']
+    deadline = time.monotonic() + 5
+    while not (rendered and rendered[0].closed) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert rendered and rendered[0].closed
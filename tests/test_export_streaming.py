@@ -0,0 +1,81 @@
+import tempfile
+
+from reportlab.lib.styles import getSampleStyleSheet
+
+from app import add_feedback_blocks, app, stream_export
+
+
+def test_export_pdf_content_length_matches_body():
+    response = app.test_client().post('/export_pdf', json={'name': 'Jane Doe', 'template': 'classic'})
+
+    body = response.get_data()
+    assert response.status_code == 200
+    assert body.startswith(b'%PDF')
+    assert int(response.headers['Content-Length']) == len(body)
+
+
+def test_download_report_content_length_matches_body():
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['last_analysis'] = {
+            'resume_text': 'Jane Doe & Co <resume>',
+            'feedback': 'OVERALL SCORE: 7/10\n\nSTRENGTHS:\n• Clear <b> layout & tone',
+            'timestamp': 'test',
+        }
+
+    response = client.get('/download_report')
+
+    body = response.get_data()
+    assert response.status_code == 200
+    assert int(response.headers['Content-Length']) == len(body)
+
+
+def spooled(body):
+    export_file = tempfile.SpooledTemporaryFile()
+    export_file.write(body)
+    export_file.seek(0)
+    return export_file
+
+
+def test_stream_export_closes_file_after_streaming():
+    body = b'x' * (app.config['EXPORT_STREAM_CHUNK_SIZE'] * 2 + 10)
+    export_file = spooled(body)
+
+    with app.test_request_context():
+        response = stream_export(export_file, len(body), 'resume.pdf', 'application/pdf')
+    chunks = list(response.response)
+
+    assert b''.join(chunks) == body
+    assert len(chunks) == 3
+    assert export_file.closed
+
+
+def test_stream_export_closes_file_when_response_closed_early():
+    export_file = spooled(b'%PDF-1.4')
+
+    with app.test_request_context():
+        response = stream_export(export_file, 8, 'resume.pdf', 'application/pdf')
+    response.close()
+
+    assert export_file.closed
+
+
+def test_feedback_lines_are_grouped_into_blocks():
+    styles = getSampleStyleSheet()
+    story = []
+
+    add_feedback_blocks(story, 'STRENGTHS:\n• One\n• Two\n\nWEAKNESSES:\n• Three', styles['Normal'], styles['Italic'])
+
+    assert len(story) == 2
+    assert story[0].text == 'STRENGTHS:<br/>• One<br/>• Two'
+
+
+def test_feedback_blocks_capped_with_truncation_note():
+    styles = getSampleStyleSheet()
+    story = []
+    feedback = '\n\n'.join(f'• Point {i}' for i in range(app.config['REPORT_MAX_FLOWABLES'] * 2))
+
+    add_feedback_blocks(story, feedback, styles['Normal'], styles['Italic'])
+
+    assert len(story) == app.config['REPORT_MAX_FLOWABLES'] + 1
+    assert story[-1].text == 'Analysis truncated for length.'
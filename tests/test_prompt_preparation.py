@@ -0,0 +1,245 @@
+import io
+import re
+from types import SimpleNamespace
+
+from reportlab.pdfgen import canvas
+
+import app as app_module
+from app import (app, count_message_tokens, count_tokens, get_token_encoding, log_token_usage,
+                 normalize_prompt_text, pick_max_tokens, strip_page_artifacts, trim_to_token_budget)
+
+HEADER = 'Jane Doe   |   jane@example.com'
+BULLET = '• Shipped features used by millions of customers.'
+JOBS = [
+    ('Software Engineer', 'Acme Corp', 'Remote'),
+    ('Software Engineer', 'Globex', 'Remote'),
+    ('Software Engineer', 'Initech', 'Remote'),
+]
+
+
+def prepare(pages):
+    return normalize_prompt_text('\n'.join(strip_page_artifacts(pages))).split('\n')
+
+
+def assert_jobs_kept(lines):
+    assert lines.count('Software Engineer') == len(JOBS)
+    assert lines.count('Remote') == len(JOBS)
+    assert all(company in lines for _, company, _ in JOBS)
+
+
+def test_page_artifacts_removed_but_jobs_kept():
+    pages = [
+        '\n'.join([HEADER, 'Senior engineer with ten years of experience.', *JOBS[0], BULLET, BULLET, 'Page 1 of 3']),
+        '\n'.join([HEADER, BULLET, *JOBS[1], BULLET, 'Page 2 of 3']),
+        '\n'.join([HEADER, *JOBS[2], BULLET, 'Python, SQL, Leadership', 'Page 3 of 3']),
+    ]
+
+    lines = prepare(pages)
+
+    assert_jobs_kept(lines)
+    assert lines.count('Jane Doe | jane@example.com') == 1
+    assert not any(line.startswith('Page ') for line in lines)
+
+
+def test_jobs_at_page_edges_kept():
+    # Page breaks land right on job titles and locations, but not on every page
+    pages = [
+        '\n'.join(['Jane Doe', BULLET, *JOBS[0]]),
+        '\n'.join([*JOBS[1], BULLET, BULLET]),
+        '\n'.join([BULLET, *JOBS[2]]),
+    ]
+
+    assert_jobs_kept(prepare(pages))
+
+
+def test_two_page_resume_keeps_matching_last_lines():
+    pages = [
+        'Jane Doe\nSoftware Engineer\nAcme Corp\nRemote\n2019 - 2021',
+        'Data Analyst\nGlobex\nRemote\n2016 - 2018\nClass of 2016',
+    ]
+    pages_ending_alike = [pages[0] + '\nRemote', pages[1] + '\nRemote']
+
+    assert '2016 - 2018' in prepare(pages)
+    assert '2016 - 2018' in prepare([pages[0] + '\nClass of 2014', pages[1]])
+    assert prepare(pages_ending_alike).count('Remote') == 4
+
+
+def test_two_page_resume_still_drops_page_numbers():
+    lines = prepare(['Jane Doe\nSoftware Engineer\n1', 'Data Analyst\nPage 2 of 2'])
+
+    assert lines == ['Jane Doe', 'Software Engineer', 'Data Analyst']
+
+
+def test_normalize_keeps_repeated_lines():
+    text = '\n'.join(line for job in JOBS for line in (*job, BULLET))
+    text = text.replace('Remote', 'Remote  ') + '\n\n\n\nSkills'
+
+    lines = normalize_prompt_text(text).split('\n')
+
+    assert_jobs_kept(lines)
+    assert lines.count(BULLET) == len(JOBS)
+    assert '' not in lines[:-2]
+
+
+def test_upload_strips_headers_and_keeps_jobs():
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for number, job in enumerate(JOBS, start=1):
+        pdf.drawString(72, 800, 'Jane Doe | jane@example.com')
+        for offset, line in enumerate((*job, BULLET)):
+            pdf.drawString(72, 760 - offset * 20, line)
+        pdf.drawString(72, 40, f'Page {number} of {len(JOBS)}')
+        pdf.showPage()
+    pdf.save()
+    buffer.seek(0)
+
+    response = app.test_client().post(
+        '/upload_resume',
+        data={'resume_file': (buffer, 'resume.pdf')},
+        content_type='multipart/form-data',
+    )
+    lines = response.get_json()['text'].split('\n')
+
+    assert_jobs_kept(lines)
+    assert lines.count('Jane Doe | jane@example.com') == 1
+    assert not any(line.startswith('Page ') for line in lines)
+
+
+class WordEncoding:
+    """Stand-in for a tiktoken encoding: one token per word, symbol or whitespace run"""
+
+    def encode(self, text, disallowed_special=()):
+        return re.findall(r'\w+|[^\w\s]|\s+', text)
+
+    def decode(self, tokens):
+        return ''.join(tokens)
+
+
+def use_word_encoding(monkeypatch):
+    monkeypatch.setitem(app_module.TOKEN_ENCODINGS, 'word-model', WordEncoding())
+    return 'word-model'
+
+
+def test_count_tokens_uses_encoding(monkeypatch):
+    model = use_word_encoding(monkeypatch)
+
+    assert count_tokens('Led a team.', model) == 6
+    assert count_message_tokens([{'role': 'user', 'content': 'Led a team.'}], model) == 6 + 4 + 3
+
+
+def test_count_tokens_estimates_without_encoding(monkeypatch):
+    monkeypatch.setattr(app_module, 'get_token_encoding', lambda model: None)
+
+    assert count_tokens('x' * 40, 'any-model') == 10
+    assert count_tokens('x' * 41, 'any-model') == 11
+
+
+def test_trim_to_token_budget_leaves_short_text_alone(monkeypatch):
+    model = use_word_encoding(monkeypatch)
+
+    assert trim_to_token_budget('Led a team.', 50, model) == 'Led a team.'
+
+
+def test_trim_to_token_budget_stays_within_budget(monkeypatch):
+    model = use_word_encoding(monkeypatch)
+    text = '\n'.join(f'• Shipped feature {i} for customers.' for i in range(100))
+
+    trimmed = trim_to_token_budget(text, 50, model)
+
+    assert count_tokens(trimmed, model) <= 50
+    assert trimmed.endswith('[...truncated]')
+    assert trimmed.startswith('• Shipped feature 0 for customers.')
+
+
+def test_trim_to_token_budget_cuts_single_long_line_by_tokens(monkeypatch):
+    model = use_word_encoding(monkeypatch)
+    text = ' '.join(['word'] * 500)
+
+    trimmed = trim_to_token_budget(text, 50, model)
+
+    assert count_tokens(trimmed, model) <= 50
+    assert trimmed.startswith('word word')
+
+
+def test_trim_to_token_budget_estimate_stays_within_budget(monkeypatch):
+    monkeypatch.setattr(app_module, 'get_token_encoding', lambda model: None)
+
+    for text in ('x' * 5000, '\n'.join(['some resume line'] * 300)):
+        assert count_tokens(trim_to_token_budget(text, 50, 'any-model'), 'any-model') <= 50
+
+
+def test_pick_max_tokens_respects_context_window(monkeypatch):
+    monkeypatch.setitem(app.config, 'AI_CONTEXT_WINDOW', 1000)
+
+    assert pick_max_tokens(100, 300) == 300
+    assert pick_max_tokens(800, 300) == 200
+    assert pick_max_tokens(990, 300) == 64
+
+
+def test_log_token_usage_reports_billed_and_estimated(capsys):
+    usage = SimpleNamespace(prompt_tokens=120, completion_tokens=80, total_tokens=200)
+
+    log_token_usage('reviewer', 118, 800, SimpleNamespace(usage=usage))
+    log_token_usage('ai_suggest', 40, 150, SimpleNamespace())
+
+    out = capsys.readouterr().out.splitlines()
+    assert out == [
+        '[reviewer] tokens: prompt=120 (est 118) completion=80/800 total=200',
+        '[ai_suggest] tokens: prompt~40 max_completion=150',
+    ]
+
+
+def test_failed_encoding_load_is_retried_later(monkeypatch):
+    calls = []
+
+    def encoding_for_model(model):
+        calls.append(model)
+        if len(calls) == 1:
+            raise OSError('offline')
+        return WordEncoding()
+
+    monkeypatch.setattr(app_module, 'tiktoken', SimpleNamespace(encoding_for_model=encoding_for_model))
+    monkeypatch.setattr(app_module, 'TOKEN_ENCODINGS', {})
+    monkeypatch.setattr(app_module, 'TOKEN_ENCODING_FAILURES', {})
+
+    assert get_token_encoding('retry-model') is None
+    assert get_token_encoding('retry-model') is None
+    assert len(calls) == 1
+
+    app_module.TOKEN_ENCODING_FAILURES['retry-model'] -= app_module.TOKEN_ENCODING_RETRY_SECONDS
+    assert isinstance(get_token_encoding('retry-model'), WordEncoding)
+    assert isinstance(get_token_encoding('retry-model'), WordEncoding)
+    assert len(calls) == 2
+
+
+def test_ai_suggest_rejects_content_over_budget_instead_of_trimming(monkeypatch):
+    def create(**kwargs):
+        raise AssertionError('over-budget content must not reach the model')
+
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(app_module, 'client', fake_client)
+    monkeypatch.setitem(app.config, 'SUGGEST_INPUT_TOKEN_BUDGET', 20)
+
+    response = app.test_client().post('/ai_suggest', json={'section': 'summary', 'content': 'word ' * 200})
+
+    assert response.status_code == 400
+    assert 'Content too long' in response.get_json()['error']
+
+
+def test_ai_suggest_sends_content_in_full(monkeypatch):
+    sent = {}
+
+    def create(**kwargs):
+        sent.update(kwargs)
+        message = SimpleNamespace(content='Rewritten summary')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(app_module, 'client', fake_client)
+    content = 'Engineer   with ten years\n\n\n\nof experience. ' * 10
+
+    response = app.test_client().post('/ai_suggest', json={'section': 'summary', 'content': content})
+
+    assert response.get_json() == {'suggestion': 'Rewritten summary'}
+    assert normalize_prompt_text(content) in sent['messages'][1]['content']
+    assert '[...truncated]' not in sent['messages'][1]['content']
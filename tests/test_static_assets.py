@@ -0,0 +1,85 @@
+import gzip
+import os
+import re
+
+import pytest
+
+import app as app_module
+from app import app
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+
+
+def read_static(name):
+    with open(os.path.join(STATIC_DIR, name), 'rb') as f:
+        return f.read()
+
+
+def asset_urls():
+    html = app.test_client().get('/', headers={'Accept-Encoding': 'identity'}).get_data(as_text=True)
+    return {stem: hashed for hashed, stem in re.findall(r'/assets/((\w+)\.[0-9a-f]{12}\.(?:css|js))', html)}
+
+
+def test_pages_link_fingerprinted_assets():
+    urls = asset_urls()
+
+    assert set(urls) == {'style', 'scripts'}
+    for hashed in urls.values():
+        response = app.test_client().get(f'/assets/{hashed}', headers={'Accept-Encoding': 'identity'})
+        assert response.status_code == 200
+        assert response.headers['Cache-Control'] == 'public, max-age=31536000, immutable'
+        assert 'Content-Encoding' not in response.headers
+
+
+def test_identity_asset_matches_file():
+    response = app.test_client().get(f"/assets/{asset_urls()['style']}", headers={'Accept-Encoding': 'identity'})
+
+    assert response.mimetype == 'text/css'
+    assert response.get_data() == read_static('style.css')
+
+
+@pytest.mark.parametrize('name', ['style.css', 'style.000000000000.css', 'missing.css'])
+def test_unhashed_or_unknown_asset_names_404(name):
+    assert app.test_client().get(f'/assets/{name}').status_code == 404
+
+
+def test_gzip_is_picked_when_accepted():
+    response = app.test_client().get(f"/assets/{asset_urls()['scripts']}", headers={'Accept-Encoding': 'gzip'})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Vary'] == 'Accept-Encoding'
+    assert gzip.decompress(response.get_data()) == read_static('scripts.js')
+
+
+@pytest.mark.skipif(app_module.brotli is None, reason='Brotli not installed')
+def test_brotli_is_preferred_when_accepted():
+    response = app.test_client().get(f"/assets/{asset_urls()['scripts']}", headers={'Accept-Encoding': 'gzip, br'})
+
+    assert response.headers['Content-Encoding'] == 'br'
+    assert app_module.brotli.decompress(response.get_data()) == read_static('scripts.js')
+
+
+def test_asset_if_none_match_gives_304():
+    client = app.test_client()
+    url = f"/assets/{asset_urls()['style']}"
+    etag = client.get(url, headers={'Accept-Encoding': 'gzip'}).headers['ETag']
+
+    response = client.get(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert response.get_data() == b''
+
+
+@pytest.mark.parametrize('path', ['/', '/templates'])
+def test_static_pages_revalidate_with_etag(path):
+    client = app.test_client()
+    first = client.get(path, headers={'Accept-Encoding': 'gzip'})
+
+    assert first.status_code == 200
+    assert first.headers['Content-Encoding'] == 'gzip'
+    assert first.headers['Cache-Control'] == 'no-cache'
+    assert b'</html>' in gzip.decompress(first.get_data())
+
+    again = client.get(path, headers={'Accept-Encoding': 'gzip', 'If-None-Match': first.headers['ETag']})
+    assert again.status_code == 304
+    assert again.get_data() == b''